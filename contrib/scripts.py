@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import os
 import re
 import sys
-from inspect import getmembers
+from inspect import getattr_static
 from inspect import getsource
 from inspect import isclass
 from pathlib import Path
@@ -29,16 +30,32 @@ def cli() -> None:
 # None right now :)
 IGNORED_TESTS: frozenset[str] = frozenset()
 
+SKIP_RE = re.compile(r"@unittest.skip")
+BOOK_TEST_RE = re.compile(r"@book_test\(Booking\.(.*)\)")
+# Transactions without postings (which need a dummy posting to parse).
+TXN_WITHOUT_POSTINGS_RE = re.compile(
+    r"(?P<error>error: \".*\")|(?P<tag>#\w+)\n(?! )"
+)
+
+
+HEADER_SEP_LINE = f";{'=' * 78}\n"
+SEP_LINE = f";{'-' * 78}\n"
+
+
+def _add_dummy_posting(match: re.Match[str]) -> str:
+    error = match["error"]
+    if error is not None:
+        return f"{error}\n  Assets:Dummy"
+    return f"{match['tag']}\n  Assets:Dummy\n"
+
 
 def _format_snapshot(title: str, contents: str, expected: str) -> str:
     """Format a Beancount snapshot."""
-    header_sep_line = f";{'=' * 78}\n"
-    sep_line = f";{'-' * 78}\n"
-    expected_escaped = "\n; ".join(expected.split("\n"))
+    expected_escaped = expected.replace("\n", "\n; ")
     return (
-        f"{header_sep_line}; {title}\n{header_sep_line}"
+        f"{HEADER_SEP_LINE}; {title}\n{HEADER_SEP_LINE}"
         f"{contents}"
-        f"{sep_line}; {expected_escaped}\n"
+        f"{SEP_LINE}; {expected_escaped}\n"
     )
 
 
@@ -54,6 +71,7 @@ def import_booking_tests() -> None:
     sys.path.pop(0)
 
     BOOKING_TEST_PATH.mkdir(exist_ok=True)
+    existing_files = {entry.name for entry in os.scandir(BOOKING_TEST_PATH)}
     base_cls = booking_full_test._BookingTestBase  # noqa: SLF001
 
     ignored_test_ids = set()
@@ -61,25 +79,26 @@ def import_booking_tests() -> None:
 
     skipped_classes = set()
 
+    # Look up members statically, without invoking any descriptors.
     for cls_name, member in (
         (name, member)
-        for name, member in getmembers(booking_full_test)
+        for name, member in sorted(vars(booking_full_test).items())
         if isclass(member) and issubclass(member, base_cls)
     ):
         source = getsource(member)
-        match = re.search(r"@unittest.skip", source)
+        match = SKIP_RE.search(source)
         if match:
             skipped_classes.add(cls_name)
             continue
         secho(f"INFO: tests in {cls_name}", fg="green")
 
         for method_name, method in (
-            (name, member)
-            for name, member in getmembers(member)
+            (name, getattr_static(member, name))
+            for name in dir(member)
             if name.startswith("test_")
         ):
             source = getsource(method)
-            match = re.search(r"@book_test\(Booking\.(.*)\)", source)
+            match = BOOK_TEST_RE.search(source)
             assert match
             booking_method = match.group(1)
 
@@ -93,26 +112,25 @@ def import_booking_tests() -> None:
 
             excluded: set[str] = set()
             if booking_method not in excluded:
-                target_path = BOOKING_TEST_PATH / f"{test_id}.beancount"
+                target_name = f"{test_id}.beancount"
                 contents = dedent(method.__doc__)
                 # uro-parser doesn't support txns without postings, add dummy
-                contents = re.sub(
-                    r"error: \".*\"", r"\g<0>\n  Assets:Dummy", contents
-                )
-                contents = re.sub(
-                    r"(#\w+)\n(?! )", r"\g<1>\n  Assets:Dummy\n", contents
+                contents = TXN_WITHOUT_POSTINGS_RE.sub(
+                    _add_dummy_posting, contents
                 )
 
                 assert test_id not in imported_test_ids
                 imported_test_ids.add(test_id)
 
-                if not target_path.exists():
+                if target_name not in existing_files:
                     snapshot_contents = _format_snapshot(
                         title=test_id,
                         contents=contents + "\n",
                         expected="EXPECTED",
                     )
-                    target_path.write_text(snapshot_contents)
+                    (BOOKING_TEST_PATH / target_name).write_bytes(
+                        snapshot_contents.encode("utf-8")
+                    )
                     secho(f"IMPORTED: {test_id}", fg="green")
                 else:
                     secho(f"IGNORED: already exists: {test_id}", fg="green")
@@ -5,8 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from uromyces import _uromyces
+from uromyces._cache import clear_load_cache
+from uromyces._cache import load_file_cached
 from uromyces._plugins import run
 from uromyces._types import Directive
+from uromyces._types import DIRECTIVE_TYPES
 from uromyces._uromyces import Amount
 from uromyces._uromyces import Balance
 from uromyces._uromyces import Close
@@ -55,6 +58,7 @@ __all__ = [  # noqa: RUF022
     "Cost",
     "CustomValue",
     "Directive",
+    "DIRECTIVE_TYPES",
     "EntryMeta",
     "Ledger",
     "Posting",
@@ -65,6 +69,7 @@ __all__ = [  # noqa: RUF022
     "RawPosting",
     "RawTransaction",
     # Functions
+    "clear_load_cache",
     "convert_entries",
     "convert_options",
     "load_file",
@@ -76,39 +81,42 @@ __all__ = [  # noqa: RUF022
 try:
     from fava.beans import abc
 
-    # Register
-    abc.Posting.register(Posting)
-
-    # Register entry types
-    abc.Balance.register(Balance)
-    abc.Close.register(Close)
-    abc.Commodity.register(Commodity)
-    abc.Custom.register(Custom)
-    abc.Document.register(Document)
-    abc.Event.register(Event)
-    abc.Note.register(Note)
-    abc.Open.register(Open)
-    abc.Pad.register(Pad)
-    abc.Price.register(Price)
-    abc.Query.register(Query)
-    abc.Transaction.register(Transaction)
+    # The ABCs have the same names as the corresponding uromyces types.
+    for _cls in (Posting, *DIRECTIVE_TYPES):
+        getattr(abc, _cls.__name__).register(_cls)
+    del _cls
 except ImportError:  # pragma: no cover
     # Nothing to register if Fava is not installed
     pass
 
 
-def load_file(filename: Path | str) -> Ledger:
+def _parse_file(filename: str, *, use_cache: bool = False) -> Ledger:
+    """Parse and book a Beancount file (see :func:`load_file`)."""
+    if use_cache:
+        return load_file_cached(filename)
+    return _uromyces.load_file(filename)
+
+
+def _finish_ledger(ledger: Ledger) -> None:
+    """Run the plugins and validations on a parsed and booked ledger."""
+    run(ledger)
+    ledger.run_validations()
+
+
+def load_file(filename: Path | str, *, use_cache: bool = False) -> Ledger:
     """Load a Beancount file.
 
     Args:
         filename: The string filename to load.
+        use_cache: Reuse the result of parsing and booking from a previous
+            load of this file if neither it nor any of its includes changed.
+            Plugins and validations are still run on every load.
 
     Returns:
         The ledger.
     """
-    ledger = _uromyces.load_file(str(filename))
-    run(ledger)
-    ledger.run_validations()
+    ledger = _parse_file(str(filename), use_cache=use_cache)
+    _finish_ledger(ledger)
     return ledger
 
 
@@ -125,6 +133,5 @@ def load_string(string: str, filename: Path | str | None = None) -> Ledger:
     ledger = _uromyces.load_string(
         string, str(filename) if filename else "<string>"
     )
-    run(ledger)
-    ledger.run_validations()
+    _finish_ledger(ledger)
     return ledger
@@ -0,0 +1,107 @@
+"""Cache of parsed and booked ledgers for :func:`uromyces.load_file`."""
+
+from __future__ import annotations
+
+from copy import copy
+from os import stat
+from time import time_ns
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from uromyces import _uromyces
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from uromyces import Ledger
+
+# The (mtime, size) of each of the files of a ledger.
+_FileStats = tuple[tuple[int, int], ...]
+
+# The files matching each of the include patterns of a ledger.
+_IncludeMatches = tuple[tuple[str, ...], ...]
+
+# Files that were modified this shortly (in ns) before a load are not cached.
+# Due to the granularity of file timestamps, a change to them during or right
+# after the load might otherwise not change their stats.
+_RACY_WINDOW = 2_000_000_000
+
+_LOAD_CACHE_SIZE = 32
+
+
+class _CachedLedger(NamedTuple):
+    ledger: Ledger
+    stats: _FileStats
+    include_matches: _IncludeMatches
+
+
+# Parsed and booked ledgers (before plugins are run) by filename, from least
+# to most recently used.
+_LOAD_CACHE: dict[str, _CachedLedger] = {}
+
+
+def _file_stats(filenames: Iterable[str]) -> _FileStats | None:
+    """Get the modification time and size of the files (if they all exist)."""
+    try:
+        return tuple((s.st_mtime_ns, s.st_size) for s in map(stat, filenames))
+    except OSError:
+        return None
+
+
+def _include_matches(ledger: Ledger) -> _IncludeMatches | None:
+    """Find the files currently matching the include patterns of the ledger.
+
+    The includes recorded on the ledger only cover the files that existed on
+    loading, so the patterns are needed to notice newly created files.
+    """
+    try:
+        return tuple(
+            tuple(_uromyces.glob_include(filename, pattern))
+            for filename, pattern in ledger.include_patterns
+        )
+    except ValueError:
+        return None
+
+
+def _is_unchanged(cached: _CachedLedger) -> bool:
+    """Check whether all the files of the cached ledger are unchanged."""
+    stats = _file_stats(cached.ledger.includes)
+    return stats == cached.stats and (
+        _include_matches(cached.ledger) == cached.include_matches
+    )
+
+
+def load_file_cached(filename: str) -> Ledger:
+    """Load a file, reusing the parsed ledger if none of its files changed."""
+    cached = _LOAD_CACHE.pop(filename, None)
+    if cached is not None and _is_unchanged(cached):
+        _LOAD_CACHE[filename] = cached
+        return copy(cached.ledger)
+
+    stats_before = _file_stats([filename])
+    started = time_ns()
+    ledger = _uromyces.load_file(filename)
+    includes = ledger.includes
+    stats = _file_stats(includes)
+    if (
+        stats is None
+        or stats_before != _file_stats([filename])
+        or any(mtime > started - _RACY_WINDOW for mtime, _ in stats)
+    ):
+        return ledger
+    include_matches = _include_matches(ledger)
+    if include_matches is None or not {
+        file for files in include_matches for file in files
+    }.issubset(includes):
+        # A matching file was created after the includes were resolved.
+        return ledger
+
+    if len(_LOAD_CACHE) >= _LOAD_CACHE_SIZE:
+        del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+    _LOAD_CACHE[filename] = _CachedLedger(copy(ledger), stats, include_matches)
+    return ledger
+
+
+def clear_load_cache() -> None:
+    """Clear the cache of parsed files used by :func:`uromyces.load_file`."""
+    _LOAD_CACHE.clear()
@@ -4,17 +4,20 @@ from __future__ import annotations
 
 import logging
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pprint import pformat
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 import click
 
+from uromyces import _finish_ledger
+from uromyces import _parse_file
 from uromyces import load_file
-from uromyces._compare import compare_entries
-from uromyces._compat import load_beancount
-from uromyces._convert import beancount_entries
-from uromyces._convert import convert_options
+
+if TYPE_CHECKING:
+    from uromyces import Ledger
 
 logger = getLogger(__name__)
 
@@ -31,6 +34,13 @@ def cli() -> None: ...
 FILENAME_TYPE = click.Path(exists=True, dir_okay=False, resolve_path=True)
 
 
+def _timed_parse(filename: str) -> tuple[Ledger, float]:
+    """Parse and book the file and also return the time taken (in seconds)."""
+    before = perf_counter()
+    ledger = _parse_file(filename)
+    return ledger, perf_counter() - before
+
+
 @cli.command()
 @click.argument("filenames", nargs=-1, type=FILENAME_TYPE)
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output.")
@@ -42,20 +52,24 @@ def check(*, filenames: tuple[str, ...], verbose: bool) -> None:
     logging.basicConfig(level=logging.INFO if verbose else logging.WARNING)
     has_errors = False
 
-    for filename in filenames:
-        before = time.time()
-        ledger = load_file(filename)
-        logger.info(
-            "Loaded Beancount ledger (%s entries; %s errors) in %s",
-            len(ledger.entries),
-            len(ledger.errors),
-            time.time() - before,
-        )
+    # Parsing and booking in Rust release the GIL, so multiple files can be
+    # loaded in parallel. Plugins are run one ledger at a time (in the order
+    # of the files), since they can modify global state like sys.path.
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        for ledger, parse_elapsed in executor.map(_timed_parse, filenames):
+            before = perf_counter()
+            _finish_ledger(ledger)
+            logger.info(
+                "Loaded Beancount ledger (%s entries; %s errors) in %s",
+                len(ledger.entries),
+                len(ledger.errors),
+                parse_elapsed + perf_counter() - before,
+            )
 
-        for error in ledger.errors:
-            msg = click.style(error.message, fg="red")
-            click.echo(f"{error.filename}:{error.lineno}:{msg}", err=True)
-        has_errors = has_errors or bool(ledger.errors)
+            for error in ledger.errors:
+                msg = click.style(error.message, fg="red")
+                click.echo(f"{error.filename}:{error.lineno}:{msg}", err=True)
+            has_errors = has_errors or bool(ledger.errors)
 
     if has_errors:
         sys.exit(1)
@@ -83,10 +97,14 @@ def compare(
     Some metadata fields (__tolerances__ and __automatic__) are ignored.
     """
     # Lazily import here to improve startup performance - in particular
-    # the Fava one is slow.
+    # the Fava one and the Beancount loader are slow.
     from beancount.core import data  # noqa: PLC0415
     from fava.core.tree import Tree  # noqa: PLC0415
 
+    from uromyces._compare import compare_entries  # noqa: PLC0415
+    from uromyces._compat import load_beancount  # noqa: PLC0415
+    from uromyces._convert import convert_options  # noqa: PLC0415
+
     logging.basicConfig(level=logging.INFO if verbose else logging.WARNING)
 
     ledger = load_file(filename)
@@ -109,20 +127,16 @@ def compare(
         else:
             click.echo(f"{msg}", err=True)
 
-    entries_uromyces = data.sorted(beancount_entries(ledger.entries))
+    entries_uromyces = data.sorted(ledger._convert_entries())  # noqa: SLF001
 
     if diff_balances:
-        balances_beancount = {
-            n.name: n.balance.to_strings()
-            for n in Tree(entries_beancount).values()
-        }
-        balances_uromyces = {
-            n.name: n.balance.to_strings()
-            for n in Tree(entries_uromyces).values()
-        }
-        for account, balance_beancount in balances_beancount.items():
-            balance_uromyces = balances_uromyces[account]
-            if balance_beancount != balance_uromyces:
+        tree_uromyces = Tree(entries_uromyces)
+        for account, node_beancount in Tree(entries_beancount).items():
+            # Compare the formatted balances, which (unlike the inventories)
+            # also differ on the precision and order of the positions.
+            strings_beancount = node_beancount.balance.to_strings()
+            strings_uromyces = tree_uromyces[account].balance.to_strings()
+            if strings_beancount != strings_uromyces:
                 click.echo(
                     click.style(
                         f"Found difference in account balance for {account}"
@@ -130,8 +144,8 @@ def compare(
                         fg="red",
                     )
                 )
-                click.echo(balance_beancount)
-                click.echo(balance_uromyces)
+                click.echo(strings_beancount)
+                click.echo(strings_uromyces)
 
     if print_options:
         click.echo(click.style("Beancount options:", fg="green"))
@@ -139,26 +153,26 @@ def compare(
         click.echo(click.style("uromyces options:", fg="green"))
         click.echo(pformat(convert_options(ledger)))
 
-    diff_count = 0
-    for bc, uro in zip(entries_beancount, entries_uromyces, strict=True):
-        if not compare_entries(bc, uro):
-            diff_count += 1
-            if diff_count >= 30:
-                continue
-            click.echo(
-                click.style(
-                    f"Found difference in entry on {uro.date}"
-                    " between Beancount and uromyces:",
-                    fg="red",
-                )
+    differences = [
+        (bc, uro)
+        for bc, uro in zip(entries_beancount, entries_uromyces, strict=True)
+        if not compare_entries(bc, uro)
+    ]
+    for bc, uro in differences[:30]:
+        click.echo(
+            click.style(
+                f"Found difference in entry on {uro.date}"
+                " between Beancount and uromyces:",
+                fg="red",
             )
-            click.echo(pformat(bc))
-            click.echo(pformat(uro))
+        )
+        click.echo(pformat(bc))
+        click.echo(pformat(uro))
 
-    if diff_count >= 30:
+    if len(differences) > 30:
         click.echo(
             click.style(
-                f"Found {diff_count} different entries,"
+                f"Found {len(differences)} different entries,"
                 " stopped printing after 30.",
                 fg="red",
             )
@@ -7,7 +7,9 @@ from beancount.core import data
 from beancount.core import position
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Sequence
+    from typing import Any
 
     from beancount.core import amount
     from fava.beans.protocols import Amount
@@ -18,10 +20,6 @@ TOLERANCE = Decimal("0.000000000000000000001")
 ZERO = Decimal()
 
 
-def isclose_decimal(self: Decimal, other: Decimal, tolerance: Decimal) -> bool:
-    return abs(self - other) < tolerance
-
-
 def isclose_amount(
     self: amount.Amount | Amount | None,
     other: amount.Amount | Amount | None,
@@ -29,8 +27,9 @@ def isclose_amount(
 ) -> bool:
     if self is None or other is None:
         return self == other
-    return self.currency == other.currency and isclose_decimal(
-        self.number or ZERO, other.number or ZERO, tolerance
+    return (
+        self.currency == other.currency
+        and abs((self.number or ZERO) - (other.number or ZERO)) < tolerance
     )
 
 
@@ -48,9 +47,7 @@ def isclose_cost(
         return self == other
     return (
         self.currency == other.currency
-        and isclose_decimal(
-            self.number or ZERO, other.number or ZERO, tolerance
-        )
+        and abs((self.number or ZERO) - (other.number or ZERO)) < tolerance
         and self.date == other.date
         and self.label == other.label
     )
@@ -66,45 +63,78 @@ def clean_metadata(entry: data.Directive) -> None:
         posting.meta.pop("__automatic__", None)
 
 
+def _compare_posting(
+    self: data.Posting, other: data.Posting, tolerance: Decimal
+) -> bool:
+    # Check the cheap plain equalities before comparing any Decimals.
+    return (
+        self.account == other.account
+        and self.flag == other.flag
+        and self.meta == other.meta
+        and isclose_amount(self.units, other.units, tolerance)
+        and isclose_cost(self.cost, other.cost, tolerance)
+        and isclose_amount(self.price, other.price, tolerance)
+    )
+
+
 def compare_postings(
     self: Sequence[data.Posting],
     other: Sequence[data.Posting],
     tolerance: Decimal = TOLERANCE,
 ) -> bool:
-    return len(self) == len(other) and all(
-        s.account == o.account
-        and isclose_amount(s.units, o.units, tolerance)
-        and isclose_cost(s.cost, o.cost, tolerance)
-        and isclose_amount(s.price, o.price, tolerance)
-        and s.flag == o.flag
-        and s.meta == o.meta
-        for s, o in zip(self, other, strict=True)
+    if len(self) != len(other):
+        return False
+    for s, o in zip(self, other, strict=True):
+        if not _compare_posting(s, o, tolerance):
+            return False
+    return True
+
+
+def _compare_price(
+    self: data.Price, other: data.Price, tolerance: Decimal
+) -> bool:
+    return (
+        self.meta == other.meta
+        and self.date == other.date
+        and self.currency == other.currency
+        and isclose_amount(self.amount, other.amount, tolerance)
     )
 
 
+def _compare_transaction(
+    self: data.Transaction, other: data.Transaction, tolerance: Decimal
+) -> bool:
+    return (
+        self.meta == other.meta
+        and self.date == other.date
+        and self.flag == other.flag
+        and (self.payee or "") == (other.payee or "")
+        and self.narration == other.narration
+        and self.tags == other.tags
+        and self.links == other.links
+        and compare_postings(self.postings, other.postings, tolerance)
+    )
+
+
+# Entry types that need to be compared with a tolerance for Decimals - all
+# others are just compared for equality.
+_COMPARERS: dict[type, Callable[[Any, Any, Decimal], bool]] = {
+    data.Price: _compare_price,
+    data.Transaction: _compare_transaction,
+}
+
+
 def compare_entries(
     self: data.Directive, other: data.Directive, tolerance: Decimal = TOLERANCE
 ) -> bool:
     """Compare entries with tolerance for Decimals."""
     clean_metadata(self)
-    if isinstance(self, data.Price) and isinstance(other, data.Price):
-        return (
-            self.meta == other.meta
-            and self.date == other.date
-            and self.currency == other.currency
-            and isclose_amount(self.amount, other.amount, tolerance)
-        )
-    if isinstance(self, data.Transaction) and isinstance(
-        other, data.Transaction
-    ):
-        return (
-            self.meta == other.meta
-            and self.date == other.date
-            and self.flag == other.flag
-            and (self.payee or "") == (other.payee or "")
-            and self.narration == other.narration
-            and self.tags == other.tags
-            and self.links == other.links
-            and compare_postings(self.postings, other.postings, tolerance)
-        )
+    if self is other:
+        return True
+    entry_type = type(self)
+    if entry_type is not type(other):
+        return False
+    comparer = _COMPARERS.get(entry_type)
+    if comparer is not None:
+        return comparer(self, other, tolerance)
     return self == other
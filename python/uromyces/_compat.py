@@ -8,15 +8,12 @@ if TYPE_CHECKING:
     from beancount.core import data
     from fava.beans.types import BeancountOptions
 
+_load = loader._load  # noqa: SLF001
+
 
 def load_beancount(
     filename: str,
 ) -> tuple[list[data.Directive], list[data.BeancountError], BeancountOptions]:
     """Load the given file using Beancount."""
-    entries, errors, options_map = loader._load(  # noqa: SLF001
-        [(filename, True)],
-        None,
-        None,
-        None,
-    )
+    entries, errors, options_map = _load([(filename, True)], None, None, None)
     return entries, errors, options_map
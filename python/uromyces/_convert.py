@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import copy
-from functools import singledispatch
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from beancount.core import data
@@ -24,9 +23,12 @@ from uromyces._uromyces import Posting
 from uromyces._uromyces import Price
 from uromyces._uromyces import Query
 from uromyces._uromyces import Transaction
+from uromyces._uromyces import UromycesOptions
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Sequence
+    from typing import Any
 
     from fava.beans.types import BeancountOptions
 
@@ -34,46 +36,49 @@ if TYPE_CHECKING:
     from uromyces import Ledger
 
 
-def beancount_entries(entries: Sequence[Directive]) -> list[data.Directive]:
-    """Convert entries of the ledger to Beancount entries."""
-    return [entry._convert() for entry in entries]  # noqa: SLF001
-
-
 def uromyces_entries(
     entries: Sequence[Directive | data.Directive],
 ) -> list[Directive]:
-    """Convert Beancount entries to uromyces."""
-    return list(map(beancount_to_uromyces, entries))
+    """Convert Beancount entries to uromyces.
+
+    Entries that are already uromyces entries are passed through as-is.
+    """
+    get_converter = _CONVERTERS.get
+    return [
+        (get_converter(type(entry)) or _find_converter(type(entry)))(entry)
+        for entry in entries
+    ]
+
+
+# The Beancount options that have a uromyces option of the same name.
+_MIRRORED_OPTIONS = tuple(
+    name for name in OPTIONS_DEFAULTS if hasattr(UromycesOptions, name)
+)
+
+_ROOT_ACCOUNT_NAMES = attrgetter(
+    "assets", "liabilities", "equity", "income", "expenses"
+)
 
 
 def convert_options(ledger: Ledger) -> BeancountOptions:
     """Convert the options for the given Ledger to Beancount's option dict."""
-    opts = copy.copy(OPTIONS_DEFAULTS)
+    opts = OPTIONS_DEFAULTS.copy()
     opts["include"] = ledger.includes
     opts["filename"] = ledger.filename
-    for option_name in opts:
-        if hasattr(ledger.options, option_name):
-            opts[option_name] = getattr(
-                ledger.options,
-                option_name,
-            )
-    root_accounts = ledger.options.root_accounts
-    opts["name_assets"] = root_accounts.assets
-    opts["name_liabilities"] = root_accounts.liabilities
-    opts["name_equity"] = root_accounts.equity
-    opts["name_income"] = root_accounts.income
-    opts["name_expenses"] = root_accounts.expenses
+    options = ledger.options
+    for option_name in _MIRRORED_OPTIONS:
+        opts[option_name] = getattr(options, option_name)
+    (
+        opts["name_assets"],
+        opts["name_liabilities"],
+        opts["name_equity"],
+        opts["name_income"],
+        opts["name_expenses"],
+    ) = _ROOT_ACCOUNT_NAMES(options.root_accounts)
     return opts  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
 
 
-@singledispatch
-def beancount_to_uromyces(entry: Directive | data.Directive) -> Directive:
-    """Convert a Beancount Entry to a uromyces entry."""
-    return entry  # type: ignore[return-value]  # ty:ignore[invalid-return-type]
-
-
-@beancount_to_uromyces.register(data.Balance)
-def _(entry: data.Balance) -> Balance:
+def _balance(entry: data.Balance) -> Balance:
     return Balance(
         entry.meta,
         entry.date,
@@ -83,8 +88,7 @@ def _(entry: data.Balance) -> Balance:
     )
 
 
-@beancount_to_uromyces.register(data.Commodity)
-def _(entry: data.Commodity) -> Commodity:
+def _commodity(entry: data.Commodity) -> Commodity:
     return Commodity(
         entry.meta,
         entry.date,
@@ -92,8 +96,7 @@ def _(entry: data.Commodity) -> Commodity:
     )
 
 
-@beancount_to_uromyces.register(data.Close)
-def _(entry: data.Close) -> Close:
+def _close(entry: data.Close) -> Close:
     return Close(
         entry.meta,
         entry.date,
@@ -101,8 +104,7 @@ def _(entry: data.Close) -> Close:
     )
 
 
-@beancount_to_uromyces.register(data.Custom)
-def _(entry: data.Custom) -> Custom:
+def _custom(entry: data.Custom) -> Custom:
     return Custom(
         entry.meta,
         entry.date,
@@ -111,8 +113,7 @@ def _(entry: data.Custom) -> Custom:
     )
 
 
-@beancount_to_uromyces.register(data.Document)
-def _(entry: data.Document) -> Document:
+def _document(entry: data.Document) -> Document:
     return Document(
         entry.meta,
         entry.date,
@@ -123,8 +124,7 @@ def _(entry: data.Document) -> Document:
     )
 
 
-@beancount_to_uromyces.register(data.Event)
-def _(entry: data.Event) -> Event:
+def _event(entry: data.Event) -> Event:
     return Event(
         entry.meta,
         entry.date,
@@ -133,21 +133,23 @@ def _(entry: data.Event) -> Event:
     )
 
 
-@beancount_to_uromyces.register(data.Open)
-def _(entry: data.Open) -> Open:
+# The uromyces booking methods by the corresponding Beancount ones.
+_BOOKINGS = {
+    booking: getattr(Booking, booking.value) for booking in data.Booking
+}
+
+
+def _open(entry: data.Open) -> Open:
     return Open(
         entry.meta,
         entry.date,
         entry.account,
-        entry.currencies or [],
-        None
-        if entry.booking is None
-        else getattr(Booking, entry.booking.value),
+        entry.currencies or (),
+        None if entry.booking is None else _BOOKINGS[entry.booking],
     )
 
 
-@beancount_to_uromyces.register(data.Note)
-def _(entry: data.Note) -> Note:
+def _note(entry: data.Note) -> Note:
     return Note(
         entry.meta,
         entry.date,
@@ -156,8 +158,7 @@ def _(entry: data.Note) -> Note:
     )
 
 
-@beancount_to_uromyces.register(data.Pad)
-def _(entry: data.Pad) -> Pad:
+def _pad(entry: data.Pad) -> Pad:
     return Pad(
         entry.meta,
         entry.date,
@@ -166,8 +167,7 @@ def _(entry: data.Pad) -> Pad:
     )
 
 
-@beancount_to_uromyces.register(data.Price)
-def _(entry: data.Price) -> Price:
+def _price(entry: data.Price) -> Price:
     return Price(
         entry.meta,
         entry.date,
@@ -176,8 +176,7 @@ def _(entry: data.Price) -> Price:
     )
 
 
-@beancount_to_uromyces.register(data.Query)
-def _(entry: data.Query) -> Query:
+def _query(entry: data.Query) -> Query:
     return Query(
         entry.meta,
         entry.date,
@@ -186,25 +185,72 @@ def _(entry: data.Query) -> Query:
     )
 
 
-@beancount_to_uromyces.register(data.Transaction)
-def _(entry: data.Transaction) -> Transaction:
+_POSTING_FIELDS = attrgetter(
+    "account", "units", "cost", "price", "flag", "meta"
+)
+
+
+def _transaction(entry: data.Transaction) -> Transaction:
+    posting = Posting
+    posting_fields = _POSTING_FIELDS
     return Transaction(
         entry.meta,
         entry.date,
         entry.flag or "*",
         entry.payee or "",
         entry.narration,  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
-        [
-            Posting(
-                p.account,
-                p.units,  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
-                p.cost,  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
-                p.price,  # type: ignore[arg-type]  # ty:ignore[invalid-argument-type]
-                p.flag,
-                p.meta,
-            )
-            for p in entry.postings
-        ],
+        [posting(*posting_fields(p)) for p in entry.postings],
         entry.tags,
         entry.links,
     )
+
+
+# Converters by type - a plain dict lookup is a lot cheaper than a
+# singledispatch on the hot path of converting all entries of a ledger.
+_CONVERTERS: dict[type, Callable[[Any], Directive]] = {
+    data.Balance: _balance,
+    data.Close: _close,
+    data.Commodity: _commodity,
+    data.Custom: _custom,
+    data.Document: _document,
+    data.Event: _event,
+    data.Note: _note,
+    data.Open: _open,
+    data.Pad: _pad,
+    data.Price: _price,
+    data.Query: _query,
+    data.Transaction: _transaction,
+}
+
+
+def _identity(entry: Any) -> Directive:
+    return entry  # type: ignore[no-any-return]
+
+
+def _find_converter(entry_type: type) -> Callable[[Any], Directive]:
+    """Find the converter for a type that is not in _CONVERTERS (yet).
+
+    This handles subclasses of the Beancount types (which plugins might
+    return), any other types are passed through as-is. The result is stored
+    so that the next lookup for this type is a plain dict lookup again.
+    """
+    converter = next(
+        (
+            _CONVERTERS[cls]
+            for cls in entry_type.__mro__[1:]
+            if cls in _CONVERTERS
+        ),
+        _identity,
+    )
+    _CONVERTERS[entry_type] = converter
+    return converter
+
+
+def beancount_to_uromyces(entry: Directive | data.Directive) -> Directive:
+    """Convert a Beancount Entry to a uromyces entry.
+
+    Entries of other types (like uromyces entries) are returned unchanged.
+    """
+    entry_type = type(entry)
+    converter = _CONVERTERS.get(entry_type) or _find_converter(entry_type)
+    return converter(entry)
@@ -9,7 +9,6 @@ from traceback import format_exc
 from typing import NamedTuple
 from typing import TYPE_CHECKING
 
-from uromyces._convert import beancount_entries
 from uromyces._convert import convert_options
 from uromyces._convert import uromyces_entries
 from uromyces._util import insert_sys_path
@@ -96,18 +95,15 @@ def run(ledger: Ledger) -> None:
                 if ledger.run_plugin(plugin.name):
                     # Rust implementation of the plugin
                     continue
-                entries = ledger.entries
                 with log_timing(
                     logger, "convert all uromyces entries to Beancount"
                 ):
-                    entries = beancount_entries(entries)
+                    entries = ledger._convert_entries()  # noqa: SLF001
             with log_timing(logger, f"plugin '{plugin.name}' (Python)"):
                 mod_plugins, errors = import_plugin(plugin.name)
                 plugin_errors.extend(errors)
+                conf_arg = () if plugin.config is None else (plugin.config,)
                 for func in mod_plugins:
-                    conf_arg = (
-                        () if plugin.config is None else (plugin.config,)
-                    )
                     try:
                         entries, new_errors = func(
                             entries,
@@ -115,7 +111,7 @@ def run(ledger: Ledger) -> None:
                             *conf_arg,
                         )
                         plugin_errors.extend(new_errors)
-                    except Exception:  # noqa: BLE001
+                    except Exception:  # noqa: BLE001, PERF203
                         plugin_errors.append(
                             PluginError.from_exception(
                                 f"Error running plugin '{plugin.name}'"
@@ -127,5 +123,5 @@ def run(ledger: Ledger) -> None:
         with log_timing(logger, "convert any Beancount entries to uromyces"):
             entries = uromyces_entries(entries)
         ledger.replace_entries(entries)
-    for error in plugin_errors:
-        ledger.add_error(error)
+    if plugin_errors:
+        ledger.extend_errors(plugin_errors)
@@ -32,3 +32,19 @@ Directive: TypeAlias = (
     | Query
     | Transaction
 )
+
+# The entry types as a tuple, e.g., for isinstance checks.
+DIRECTIVE_TYPES: tuple[type[Directive], ...] = (
+    Balance,
+    Close,
+    Commodity,
+    Custom,
+    Document,
+    Event,
+    Note,
+    Open,
+    Pad,
+    Price,
+    Query,
+    Transaction,
+)
@@ -352,7 +352,7 @@ class Open(_Directive, abc.Open):
         meta: EntryMeta | Meta,
         date: datetime.date,
         account: str,
-        currencies: list[str] | None,
+        currencies: Sequence[str] | None,
         booking: Booking | None,
         tags: set[str] | frozenset[str] | None = None,
         links: set[str] | frozenset[str] | None = None,
@@ -548,16 +548,21 @@ class Ledger:
     entries: list[Directive]
     errors: list[UroError]
     includes: list[str]
+    include_patterns: list[tuple[str, str]]
     options: UromycesOptions
     plugins: list[Plugin]
 
+    def __copy__(self: Ledger) -> Ledger: ...
+    def _convert_entries(self: Ledger) -> list[data.Directive]: ...
     def replace_entries(self: Ledger, entries: list[Directive]) -> None: ...
     def add_error(self: Ledger, error: Any) -> None: ...
+    def extend_errors(self: Ledger, errors: Sequence[Any]) -> None: ...
     def run_validations(self: Ledger) -> None: ...
     def run_plugin(self: Ledger, name: str) -> bool: ...
 
 def load_file(filename: str) -> Ledger: ...
 def load_string(string: str, filename: str) -> Ledger: ...
+def glob_include(filename: str, pattern: str) -> list[str]: ...
 def summarize_clamp(
     entries: Sequence[Directive],
     begin_date: datetime.date,
@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 import time
 from contextlib import contextmanager
+from contextlib import suppress
+from logging import INFO
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,16 +19,20 @@ def log_timing(
 ) -> Generator[None]:  # pragma: no cover
     """Log the time the wrapped block took.
 
+    This is a noop if the logger is not enabled for INFO messages.
+
     Args:
         logger: The logger to use.
         message: The message to log this with.
     """
-    before = time.time()
+    if not logger.isEnabledFor(INFO):
+        yield
+        return
+    before = time.perf_counter_ns()
     try:
         yield
     finally:
-        elapsed = time.time() - before
-        elapsed_ms = elapsed * 1000
+        elapsed_ms = (time.perf_counter_ns() - before) / 1_000_000
         logger.info("%7.3fms - %s", elapsed_ms, message)
 
 
@@ -37,11 +43,13 @@ def insert_sys_path(path: Path | None) -> Generator[None]:
     Args:
         path: The path to insert (can be none to make this a noop).
     """
-    sys_path_before = sys.path
-    if path is not None:
-        sys.path.insert(0, str(path))
+    if path is None:
+        yield
+        return
+    path_str = str(path)
+    sys.path.insert(0, path_str)
     try:
         yield
     finally:
-        if path is not None:
-            sys.path = sys_path_before
+        with suppress(ValueError):
+            sys.path.remove(path_str)
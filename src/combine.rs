@@ -119,14 +119,19 @@ fn combine_files(result: Vec<PathAndResult>) -> RawLedger {
     let mut t = SimpleTimer::new();
 
     // Merge all ledgers
-    for PathAndResult {
-        path: _,
-        mut result,
-    } in result
-    {
+    for PathAndResult { path, mut result } in result {
         combined
             .options
             .update_from_raw_directives(&result.directives);
+        combined
+            .include_patterns
+            .extend(result.directives.iter().filter_map(|d| {
+                if let RawDirective::Include { pattern } = d {
+                    Some((path.clone(), pattern.clone()))
+                } else {
+                    None
+                }
+            }));
         combined.entries.append(&mut result.entries);
         combined.errors.append(&mut result.errors);
         combined.plugins.append(
@@ -7,7 +7,7 @@ use crate::options::BeancountOptions;
 #[cfg(test)]
 use crate::parse::ParsedFile;
 use crate::plugins::{run_named_plugin, run_validations};
-use crate::types::{Entry, Filename, Plugin, RawEntry};
+use crate::types::{ConvertToBeancount, Entry, Filename, Plugin, RawEntry};
 
 /// The result of parsing a Beancount file and all its includes.
 #[derive(Debug, Clone)]
@@ -22,6 +22,8 @@ pub struct RawLedger {
     pub options: BeancountOptions,
     /// Included file paths.
     pub includes: Vec<Filename>,
+    /// Include patterns (with the file containing them).
+    pub include_patterns: Vec<(Filename, String)>,
     /// Plugins (with optional config)
     pub plugins: Vec<Plugin>,
 }
@@ -39,6 +41,7 @@ impl RawLedger {
             errors: Vec::default(),
             options: BeancountOptions::default(),
             includes,
+            include_patterns: Vec::default(),
             plugins: Vec::default(),
         }
     }
@@ -51,6 +54,7 @@ impl RawLedger {
             errors: parsed_file.errors,
             options: BeancountOptions::default(),
             includes: Vec::new(),
+            include_patterns: Vec::new(),
             plugins: Vec::new(),
         }
     }
@@ -75,6 +79,9 @@ pub struct Ledger {
     /// Included file paths.
     #[pyo3(get)]
     pub includes: Vec<Filename>,
+    /// Include patterns (with the file containing them).
+    #[pyo3(get)]
+    pub include_patterns: Vec<(Filename, String)>,
     /// Plugins (with optional config)
     #[pyo3(get)]
     pub plugins: Vec<Plugin>,
@@ -89,6 +96,7 @@ impl Ledger {
             errors: raw_ledger.errors.clone(),
             options: raw_ledger.options.clone(),
             includes: raw_ledger.includes.clone(),
+            include_patterns: raw_ledger.include_patterns.clone(),
             plugins: raw_ledger.plugins.clone(),
         }
     }
@@ -111,6 +119,22 @@ impl Ledger {
         py.detach(|| self.run_validations());
     }
 
+    /// Convert all entries of this ledger to Beancount namedtuples.
+    ///
+    /// This avoids creating the Python objects for all the uromyces entries that would be
+    /// needed to convert them one by one.
+    fn _convert_entries<'py>(&self, py: Python<'py>) -> PyResult<Vec<Bound<'py, PyAny>>> {
+        self.entries
+            .iter()
+            .map(|e| e.convert_to_beancount(py))
+            .collect()
+    }
+
+    /// Copy this ledger (so that it can be modified without affecting the original).
+    fn __copy__(&self) -> Self {
+        self.clone()
+    }
+
     /// Replace the entries of this ledger.
     fn replace_entries(&mut self, entries: Vec<Entry>) {
         self.entries = entries;
@@ -120,4 +144,9 @@ impl Ledger {
     fn add_error(&mut self, error: UroError) {
         self.errors.push(error);
     }
+
+    /// Append multiple errors (from the Python side).
+    fn extend_errors(&mut self, errors: Vec<UroError>) {
+        self.errors.extend(errors);
+    }
 }
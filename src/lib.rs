@@ -36,6 +36,7 @@ pub use ledgers::Ledger;
 /// [pymodule] The uromyces.uromyces Python extension module.
 #[pymodule(name = "_uromyces")]
 mod uromyces {
+    use pyo3::exceptions::PyValueError;
     use pyo3::prelude::*;
     use pyo3::types::PyMapping;
 
@@ -73,6 +74,18 @@ mod uromyces {
         py.detach(|| crate::load_string(string, filename))
     }
 
+    /// Find the files matching the include pattern in the given file.
+    #[pyfunction]
+    fn glob_include(
+        filename: AbsoluteUTF8Path,
+        pattern: &str,
+        py: Python<'_>,
+    ) -> PyResult<Vec<String>> {
+        py.detach(|| crate::util::paths::glob_include(&filename, pattern))
+            .map(|paths| paths.iter().map(ToString::to_string).collect())
+            .map_err(|e| PyValueError::new_err(format!("Include pattern '{pattern}' failed: {e}")))
+    }
+
     /// Clamp the entries to the given interval.
     #[pyfunction]
     #[allow(clippy::needless_pass_by_value)]
@@ -5,11 +5,11 @@ use pyo3::types::PyNone;
 use pyo3::{prelude::*, types::PyAnyMethods, types::PyType};
 
 use crate::types::{
-    Amount, Balance, Close, Commodity, Cost, Custom, CustomValue, Document, Event, Note, Open, Pad,
-    Posting, Price, Query, Transaction,
+    Amount, Balance, Close, Commodity, Cost, Custom, CustomValue, Document, Entry, Event, Note,
+    Open, Pad, Posting, Price, Query, Transaction,
 };
 
-pub(super) trait ConvertToBeancount {
+pub(crate) trait ConvertToBeancount {
     /// Convert an object to its matching Beancount type.
     fn convert_to_beancount<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>>;
 }
@@ -239,3 +239,22 @@ impl ConvertToBeancount for Query {
         ))
     }
 }
+
+impl ConvertToBeancount for Entry {
+    fn convert_to_beancount<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        match self {
+            Self::Balance(e) => e.convert_to_beancount(py),
+            Self::Close(e) => e.convert_to_beancount(py),
+            Self::Commodity(e) => e.convert_to_beancount(py),
+            Self::Custom(e) => e.convert_to_beancount(py),
+            Self::Document(e) => e.convert_to_beancount(py),
+            Self::Event(e) => e.convert_to_beancount(py),
+            Self::Note(e) => e.convert_to_beancount(py),
+            Self::Open(e) => e.convert_to_beancount(py),
+            Self::Pad(e) => e.convert_to_beancount(py),
+            Self::Price(e) => e.convert_to_beancount(py),
+            Self::Query(e) => e.convert_to_beancount(py),
+            Self::Transaction(e) => e.convert_to_beancount(py),
+        }
+    }
+}
@@ -1,7 +1,7 @@
 use pyo3::exceptions::{PyKeyError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::sync::PyOnceLock;
-use pyo3::types::{PyDict, PyNone, PyType};
+use pyo3::types::{PyDict, PyNone, PyString, PyType};
 use pyo3::{BoundObject, IntoPyObjectExt};
 use serde::de::{MapAccess, Visitor};
 use serde::ser::SerializeMap;
@@ -373,8 +373,9 @@ impl PostingMeta {
         let meta = obj
             .iter()
             .map(|(k, v)| {
-                let key = k.extract::<String>()?;
-                match key.as_str() {
+                // Only allocate an owned key for the keys that are actually stored.
+                let key = k.cast::<PyString>()?;
+                match key.to_str()? {
                     "filename" => {
                         filename = Some(v.extract::<Filename>()?);
                         Ok(None)
@@ -383,8 +384,8 @@ impl PostingMeta {
                         lineno = Some(v.extract::<u32>()?);
                         Ok(None)
                     }
-                    _ => Ok(Some(MetaKeyValuePair::new(
-                        key,
+                    key => Ok(Some(MetaKeyValuePair::new(
+                        key.to_owned(),
                         Some(MetaValue::extract(v.as_borrowed())?),
                     ))),
                 }
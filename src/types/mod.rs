@@ -86,7 +86,7 @@ pub use metadata::{EntryMeta, Meta, MetaKeyValuePair, MetaValue, PostingMeta};
 pub use paths::{AbsoluteUTF8Path, Filename};
 pub use tags_links::TagsLinks;
 
-use convert_to_beancount::ConvertToBeancount;
+pub(crate) use convert_to_beancount::ConvertToBeancount;
 use decimal::get_decimal_decimal;
 
 /// The type to use for line numbers in file positions.
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
 import pytest
 
+from uromyces import load_file
 from uromyces import load_string
+from uromyces._compat import load_beancount
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from beancount.core import data
+
     from uromyces import Ledger
 
 
@@ -20,8 +27,32 @@ def test_ledgers_dir() -> Path:
     return Path(__file__).parent / "ledgers"
 
 
+@pytest.fixture(scope="session")
+def example_ledger(test_ledgers_dir: Path) -> Ledger:
+    """The example ledger (shared, so tests should not modify it)."""
+    return load_file(test_ledgers_dir / "example.beancount")
+
+
 @pytest.fixture
 def load_doc(request: pytest.FixtureRequest) -> Ledger:
     """Load the docstring as a Beancount file."""
     contents = dedent(request.function.__doc__)
     return load_string(contents, str(request.path))
+
+
+@pytest.fixture(scope="session")
+def load_both(
+    test_ledgers_dir: Path,
+) -> Callable[[str], tuple[list[data.Directive], Ledger]]:
+    """Load a test ledger with both Beancount and uromyces.
+
+    Each ledger is only loaded once per test session.
+    """
+
+    @cache
+    def load(ledger_name: str) -> tuple[list[data.Directive], Ledger]:
+        filename = str(test_ledgers_dir / ledger_name)
+        entries, _errors, _options = load_beancount(filename)
+        return entries, load_file(filename)
+
+    return load
@@ -0,0 +1,144 @@
+"""Test the cache of parsed ledgers for load_file."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from uromyces import _cache
+from uromyces import _uromyces
+from uromyces import clear_load_cache
+from uromyces import load_file
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from uromyces import Ledger
+
+# A modification time (in ns) well before any test run.
+_OLD = 1_000_000_000_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    yield
+    clear_load_cache()
+
+
+def _write(path: Path, contents: str, mtime: int = _OLD) -> None:
+    """Write the file and set its modification time."""
+    path.write_text(contents, encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _load(path: Path) -> Ledger:
+    return load_file(path, use_cache=True)
+
+
+def _is_cached(path: Path) -> bool:
+    return str(path) in _cache._LOAD_CACHE  # noqa: SLF001
+
+
+def test_load_file_cached(tmp_path: Path) -> None:
+    main = tmp_path / "main.beancount"
+    included = tmp_path / "included.beancount"
+    _write(main, 'include "included.beancount"\n2020-01-01 open Assets:A\n')
+    _write(included, "2020-01-01 open Assets:B\n")
+
+    first = _load(main)
+    assert len(first.entries) == 2
+    cached = _cache._LOAD_CACHE[str(main)]  # noqa: SLF001
+    # Changes to the returned ledger do not affect the cached one.
+    first.replace_entries([])
+    second = _load(main)
+    assert _cache._LOAD_CACHE[str(main)] is cached  # noqa: SLF001
+    assert second is not first
+    assert len(second.entries) == 2
+
+    _write(included, "2020-01-01 open Assets:B\n2020-01-01 open Assets:C\n")
+    assert len(_load(main).entries) == 3
+    assert _cache._LOAD_CACHE[str(main)] is not cached  # noqa: SLF001
+
+    clear_load_cache()
+    assert not _is_cached(main)
+
+
+def test_load_file_cached_new_file_for_glob(tmp_path: Path) -> None:
+    main = tmp_path / "main.beancount"
+    _write(main, 'include "more/*.beancount"\n2020-01-01 open Assets:A\n')
+
+    assert len(_load(main).entries) == 1
+    assert _is_cached(main)
+
+    (tmp_path / "more").mkdir()
+    _write(tmp_path / "more" / "b.beancount", "2020-01-01 open Assets:B\n")
+    assert len(_load(main).entries) == 2
+    assert _is_cached(main)
+
+    # Like on loading, hidden files match the glob as well.
+    _write(tmp_path / "more" / ".c.beancount", "2020-01-01 open Assets:C\n")
+    assert len(_load(main).entries) == 3
+
+
+def test_load_file_cached_lru(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_cache, "_LOAD_CACHE_SIZE", 2)
+    first, second, third = (tmp_path / f"{n}.beancount" for n in "abc")
+    for path in (first, second, third):
+        _write(path, "2020-01-01 open Assets:A\n")
+
+    _load(first)
+    _load(second)
+    _load(first)
+    _load(third)
+    assert _is_cached(first)
+    assert not _is_cached(second)
+    assert _is_cached(third)
+
+
+def test_load_file_cached_not_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Files that do not exist.
+    missing = tmp_path / "missing.beancount"
+    assert _load(missing).errors
+    assert not _is_cached(missing)
+
+    # Files that were just modified.
+    recent = tmp_path / "recent.beancount"
+    recent.write_text("2020-01-01 open Assets:A\n", encoding="utf-8")
+    _load(recent)
+    assert not _is_cached(recent)
+
+    # Invalid include patterns.
+    invalid = tmp_path / "invalid.beancount"
+    _write(invalid, 'include "****"\n')
+    assert _load(invalid).errors
+    assert not _is_cached(invalid)
+
+    # Files that change while loading.
+    changed = tmp_path / "changed.beancount"
+    _write(changed, 'include "*.bean"\n')
+    load = _uromyces.load_file
+
+    def load_and_modify(filename: str) -> Ledger:
+        ledger = load(filename)
+        _write(changed, 'include "*.bean"\n2020-01-01 open Assets:A\n')
+        return ledger
+
+    monkeypatch.setattr(_uromyces, "load_file", load_and_modify)
+    _load(changed)
+    assert not _is_cached(changed)
+
+    def load_and_create(filename: str) -> Ledger:
+        ledger = load(filename)
+        _write(tmp_path / "new.bean", "2020-01-01 open Assets:B\n")
+        return ledger
+
+    monkeypatch.setattr(_uromyces, "load_file", load_and_create)
+    _load(changed)
+    assert not _is_cached(changed)
@@ -33,5 +33,36 @@ def test_cli(test_ledgers_dir: Path) -> None:
     )
     assert with_filename_errors.exit_code == 1
 
+    with_multiple_filenames = runner.invoke(
+        cli,
+        (
+            "check",
+            "-v",
+            filename,
+            str(test_ledgers_dir / "invalid-input.beancount"),
+        ),
+    )
+    assert with_multiple_filenames.exit_code == 1
+    assert "invalid-input.beancount" in with_multiple_filenames.output
+
     compare = runner.invoke(cli, ("compare", filename))
     assert compare.exit_code == 0
+
+
+def test_check_errors_in_order(tmp_path: Path) -> None:
+    """The errors of multiple files are output in the order of the files."""
+    filenames = [tmp_path / f"{name}.beancount" for name in "cab"]
+    for path in filenames:
+        path.write_text(
+            "invalid\n2020-01-01 close Assets:A\n", encoding="utf-8"
+        )
+
+    result = CliRunner().invoke(cli, ("check", *map(str, filenames)))
+    assert result.exit_code == 1
+    names = [str(path) for path in filenames]
+    order = [
+        names.index(line.split(":", 1)[0])
+        for line in result.output.splitlines()
+    ]
+    assert order == sorted(order)
+    assert set(order) == {0, 1, 2}
@@ -2,29 +2,88 @@
 
 from __future__ import annotations
 
+from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
+from beancount.core import data
+from beancount.core.amount import Amount
+from beancount.core.position import Cost
 from fava.core.tree import Tree
 
-import uromyces
 from uromyces._compare import clean_metadata
-from uromyces._compare import isclose_decimal
-from uromyces._compat import load_beancount
+from uromyces._compare import compare_entries
+from uromyces._compare import isclose_amount
+from uromyces._compare import isclose_cost
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
+
+    from uromyces import Ledger
+
+
+def _posting_lineno(posting: data.Posting) -> int:
+    meta = posting.meta
+    return meta.get("lineno", 0) if meta else 0
 
 
 def test_isclose() -> None:
     """Test comparison helpers"""
-    assert isclose_decimal(
-        Decimal("1.00"), Decimal("1.005"), tolerance=Decimal("0.01")
+    tolerance = Decimal("0.01")
+    one = Amount(Decimal("1.00"), "EUR")
+    assert isclose_amount(one, Amount(Decimal("1.005"), "EUR"), tolerance)
+    assert not isclose_amount(one, Amount(Decimal("1.015"), "EUR"), tolerance)
+    assert not isclose_amount(one, Amount(Decimal("1.00"), "USD"), tolerance)
+    assert not isclose_amount(one, None, tolerance)
+    assert isclose_amount(None, None, tolerance)
+
+    cost = Cost(Decimal("1.00"), "EUR", date(2022, 1, 1), None)
+    assert isclose_cost(
+        cost, cost._replace(number=Decimal("1.005")), tolerance
+    )
+    assert not isclose_cost(
+        cost, cost._replace(number=Decimal("1.015")), tolerance
     )
-    assert not isclose_decimal(
-        Decimal("1.00"), Decimal("1.015"), tolerance=Decimal("0.01")
+    assert not isclose_cost(
+        cost, cost._replace(date=date(2022, 1, 2)), tolerance
     )
+    assert not isclose_cost(cost, None, tolerance)
+
+
+def test_compare_entries() -> None:
+    meta = {"filename": "<string>", "lineno": 0}
+    day = date(2022, 12, 12)
+    note = data.Note(meta, day, "Assets:Cash", "comment", None, None)
+    assert compare_entries(note, note)
+    assert compare_entries(note, note._replace(meta=dict(meta)))
+    assert not compare_entries(note, note._replace(comment="other"))
+    close = data.Close(meta, day, "Assets:Cash")
+    assert not compare_entries(note, close)
+
+
+def test_compare_transactions() -> None:
+    meta = {"filename": "<string>", "lineno": 0}
+    units = Amount(Decimal("10.00"), "EUR")
+    cash = data.Posting("Assets:Cash", units, None, None, None, {})
+    income = data.Posting("Income:Work", -units, None, None, None, {})
+    no_tags: frozenset[str] = frozenset()
+    txn = data.Transaction(
+        meta,
+        date(2022, 12, 12),
+        "*",
+        None,
+        "",
+        no_tags,
+        no_tags,
+        [cash, income],
+    )
+    assert compare_entries(txn, txn._replace(postings=[cash, income]))
+    assert not compare_entries(txn, txn._replace(postings=[cash]))
+    assert not compare_entries(txn, txn._replace(postings=[income, cash]))
+    close_units = Amount(Decimal("10.000000000000000000000001"), "EUR")
+    close_cash = cash._replace(units=close_units)
+    assert compare_entries(txn, txn._replace(postings=[close_cash, income]))
 
 
 @pytest.mark.parametrize(
@@ -34,12 +93,12 @@ def test_isclose() -> None:
         "long-example.beancount",
     ],
 )
-def test_compare(test_ledgers_dir: Path, ledger_name: str) -> None:
+def test_compare(
+    load_both: Callable[[str], tuple[list[data.Directive], Ledger]],
+    ledger_name: str,
+) -> None:
     """Run some comparison tests between Beancount and uromyces."""
-    filename = str(test_ledgers_dir / ledger_name)
-
-    entries_bc, _errors, _options = load_beancount(filename)
-    ledger = uromyces.load_file(filename)
+    entries_bc, ledger = load_both(ledger_name)
     entries_uro = ledger.entries
 
     balances_bc = {
@@ -55,6 +114,6 @@ def test_compare(test_ledgers_dir: Path, ledger_name: str) -> None:
         clean_metadata(bc)
         postings = getattr(bc, "postings", None)
         if postings is not None:
-            postings.sort(key=lambda p: p.meta.get("lineno", 0))
+            postings.sort(key=_posting_lineno)
 
         assert uro._convert() == bc  # noqa: SLF001
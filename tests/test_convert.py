@@ -2,15 +2,42 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from beancount.core import amount
 from beancount.core import data
 
 from uromyces import Amount
 from uromyces import Balance
+from uromyces import Transaction
 from uromyces._convert import beancount_to_uromyces
+from uromyces._convert import uromyces_entries
 from uromyces._uromyces import Booking
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Any
+
+    from uromyces import Ledger
+
+
+class _SubclassedTransaction(data.Transaction):
+    """A subclass of a Beancount entry type (like a plugin might return)."""
+
+
+def _subclass_transactions(
+    entries: Sequence[data.Directive], _options_map: Any
+) -> tuple[list[data.Directive], list[Any]]:
+    return [
+        _SubclassedTransaction(*entry)
+        if isinstance(entry, data.Transaction)
+        else entry
+        for entry in entries
+    ], []
+
+
+__plugins__ = ["_subclass_transactions"]
+
 
 def test_amount_constructor() -> None:
     ten = Decimal("10.00")
@@ -38,3 +65,43 @@ def test_convert_beancount_to_uromyces() -> None:
     assert converted_bal.tags == frozenset()
     assert converted_bal.links == frozenset()
     assert converted_bal.tolerance == Decimal("0.01")
+
+
+def test_uromyces_entries_passes_through_uromyces_entries(
+    load_doc: Ledger,
+) -> None:
+    """
+    2022-12-12 open Assets:Cash
+    2022-12-12 balance Assets:Cash 0 USD
+    """
+    entries = load_doc.entries
+    converted = uromyces_entries(entries)
+    assert all(c is e for c, e in zip(converted, entries, strict=True))
+
+    beancount = load_doc._convert_entries()  # noqa: SLF001
+    assert beancount == [e._convert() for e in entries]  # noqa: SLF001
+
+    roundtrip = uromyces_entries(beancount)
+    assert roundtrip == entries
+    assert all(r is not e for r, e in zip(roundtrip, entries, strict=True))
+
+
+def test_plugin_returning_subclassed_entries(load_doc: Ledger) -> None:
+    """
+    option "insert_pythonpath" "True"
+    plugin "test_convert"
+
+    2022-01-01 open Assets:Cash
+    2022-01-01 open Income:Work
+
+    2022-01-02 * "Payday"
+      Assets:Cash   10.00 EUR
+      Income:Work
+    """
+    assert not load_doc.errors
+    txn = load_doc.entries[-1]
+    assert isinstance(txn, Transaction)
+    assert txn.narration == "Payday"
+
+    subclassed = _SubclassedTransaction(*txn._convert())  # noqa: SLF001
+    assert isinstance(beancount_to_uromyces(subclassed), Transaction)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from beancount.plugins.auto_accounts import auto_insert_open
@@ -66,6 +68,7 @@ def test_insert_pythonpath(load_doc: Ledger) -> None:
     errors = load_doc.errors
     assert errors
     assert "'str' object is not callable" in errors[0].message
+    assert str(Path(__file__).parent) not in sys.path
 
 
 def test_insert_pythonpath_no_plugins(load_doc: Ledger) -> None:
@@ -18,6 +18,7 @@ from uromyces import Commodity
 from uromyces import Cost
 from uromyces import Custom
 from uromyces import CustomValue
+from uromyces import DIRECTIVE_TYPES
 from uromyces import Document
 from uromyces import EntryMeta
 from uromyces import Event
@@ -284,6 +285,7 @@ ABSOLUTE_PATH = str(Path(__file__))
     ],
 )
 def test_entry_types(entry: Directive) -> None:
+    assert isinstance(entry, DIRECTIVE_TYPES)
     assert hash(entry)
     assert entry == entry._replace(tags={"a-tag"})
     assert entry != entry._replace(tags={"a-different-tag"})
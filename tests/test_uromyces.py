@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from datetime import date
 from pathlib import Path
 from typing import NamedTuple
+from typing import TYPE_CHECKING
 
 import pytest
+from fava.beans import abc
 
 from uromyces import Balance
+from uromyces import Close
 from uromyces import load_file
 from uromyces import load_string
 from uromyces._uromyces import Booking
 from uromyces._uromyces import Precisions
 from uromyces._uromyces import UromycesOptions
 
+if TYPE_CHECKING:
+    from uromyces import Ledger
+
 
 class _BeancountStyleError(NamedTuple):
     source: dict[str, str | int] | None
@@ -29,11 +36,19 @@ def test_load_ledger_invalid_path() -> None:
     load_string("")
 
 
-def test_load_ledger(test_ledgers_dir: Path) -> None:
-    ledger = load_file(test_ledgers_dir / "example.beancount")
-    assert ledger.entries
+def test_load_ledger(example_ledger: Ledger) -> None:
+    assert example_ledger.entries
+
+    assert repr(example_ledger.entries[0]).startswith("<Commodity")
 
-    assert repr(ledger.entries[0]).startswith("<Commodity")
+
+def test_fava_abcs_registered(example_ledger: Ledger) -> None:
+    commodity = example_ledger.entries[0]
+    assert isinstance(commodity, abc.Commodity)
+    assert not isinstance(commodity, abc.Transaction)
+
+    close = Close({"filename": "<string>", "lineno": 0}, date(2022, 1, 1), "A")
+    assert isinstance(close, abc.Close)
 
 
 def test_load_ledger_with_errors(test_ledgers_dir: Path) -> None:
@@ -53,10 +68,9 @@ def test_load_ledger_with_errors(test_ledgers_dir: Path) -> None:
     assert last_again is not last
 
 
-def test_load_ledger_options(test_ledgers_dir: Path) -> None:
-    ledger = load_file(test_ledgers_dir / "example.beancount")
-    assert ledger.entries
-    options = ledger.options
+def test_load_ledger_options(example_ledger: Ledger) -> None:
+    assert example_ledger.entries
+    options = example_ledger.options
     assert isinstance(options, UromycesOptions)
 
     assert options.title == "Example Beancount file"
@@ -100,3 +114,17 @@ def test_ledger_add_error(test_ledgers_dir: Path) -> None:
     home = str(Path.home())
     ledger.add_error(_BeancountStyleError({"filename": home}, "asdf", None))
     assert len(ledger.errors) == 2
+
+    ledger.extend_errors([_BeancountStyleError(None, "asdf", None)] * 2)
+    assert len(ledger.errors) == 4
+    with pytest.raises(AttributeError):
+        ledger.extend_errors([1])
+    with pytest.raises(TypeError, match=r"int.*not an instance.*str"):
+        ledger.extend_errors(
+            [_BeancountStyleError({"filename": 12}, "asdf", None)]
+        )
+    with pytest.raises(ValueError, match=r"not absolute"):
+        ledger.extend_errors(
+            [_BeancountStyleError({"filename": "relative"}, "asdf", None)]
+        )
+    assert len(ledger.errors) == 4